@@ -53,7 +53,10 @@ pip install --upgrade pip
 pip install -r requirements.txt
 
 echo ""
-echo "✓ All Python packages installed in virtual environment!"
+echo "✓ Core Python packages installed in virtual environment!"
+echo "  Optional provider extras:"
+echo "    pip install -r requirements-aws.txt"
+echo "    pip install -r requirements-gcp.txt"
 echo ""
 
 # Check AWS CLI (optional)
@@ -98,6 +98,7 @@ module "api_gateway_us_east_1" {
   region_name      = "us-east-1"
   target_endpoint  = var.target_endpoint
   api_gateway_role = aws_iam_role.api_gateway_role.arn
+  enable_batch     = var.enable_batch
 }
 
 # API Gateway in us-east-2
@@ -111,6 +112,7 @@ module "api_gateway_us_east_2" {
   region_name      = "us-east-2"
   target_endpoint  = var.target_endpoint
   api_gateway_role = aws_iam_role.api_gateway_role.arn
+  enable_batch     = var.enable_batch
 }
 
 # API Gateway in us-west-1
@@ -124,6 +126,7 @@ module "api_gateway_us_west_1" {
   region_name      = "us-west-1"
   target_endpoint  = var.target_endpoint
   api_gateway_role = aws_iam_role.api_gateway_role.arn
+  enable_batch     = var.enable_batch
 }
 
 # API Gateway in us-west-2
@@ -137,6 +140,7 @@ module "api_gateway_us_west_2" {
   region_name      = "us-west-2"
   target_endpoint  = var.target_endpoint
   api_gateway_role = aws_iam_role.api_gateway_role.arn
+  enable_batch     = var.enable_batch
 }
 
 # API Gateway in eu-west-1
@@ -150,5 +154,6 @@ module "api_gateway_eu_west_1" {
   region_name      = "eu-west-1"
   target_endpoint  = var.target_endpoint
   api_gateway_role = aws_iam_role.api_gateway_role.arn
+  enable_batch     = var.enable_batch
 }
 
@@ -0,0 +1,95 @@
+# Optional batch aggregator: POST /batch fans a list of small GETs out from
+# one Lambda invocation (see batch/handler.py). Enabled with enable_batch.
+
+data "archive_file" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  type        = "zip"
+  source_file = "${path.module}/batch/handler.py"
+  output_path = "${path.root}/.terraform/proxy-rot-batch-${var.region_name}.zip"
+}
+
+resource "aws_iam_role" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  name = "proxy-rot-batch-${var.region_name}"
+  
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "lambda.amazonaws.com"
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_iam_role_policy_attachment" "batch_logs" {
+  count = var.enable_batch ? 1 : 0
+  
+  role       = aws_iam_role.batch[0].name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"
+}
+
+resource "aws_lambda_function" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  function_name    = "proxy-rot-batch-${var.region_name}"
+  description      = "PROXY ROT - batch aggregator for ${var.region_name}"
+  role             = aws_iam_role.batch[0].arn
+  runtime          = "python3.12"
+  handler          = "handler.lambda_handler"
+  filename         = data.archive_file.batch[0].output_path
+  source_code_hash = data.archive_file.batch[0].output_base64sha256
+  timeout          = 29
+  memory_size      = 256
+  
+  environment {
+    variables = {
+      TARGET_ENDPOINT = var.target_endpoint
+    }
+  }
+}
+
+resource "aws_api_gateway_resource" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  rest_api_id = aws_api_gateway_rest_api.proxy_rot.id
+  parent_id   = aws_api_gateway_rest_api.proxy_rot.root_resource_id
+  path_part   = "batch"
+}
+
+resource "aws_api_gateway_method" "batch_post" {
+  count = var.enable_batch ? 1 : 0
+  
+  rest_api_id   = aws_api_gateway_rest_api.proxy_rot.id
+  resource_id   = aws_api_gateway_resource.batch[0].id
+  http_method   = "POST"
+  authorization = "NONE"
+}
+
+resource "aws_api_gateway_integration" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  rest_api_id = aws_api_gateway_rest_api.proxy_rot.id
+  resource_id = aws_api_gateway_resource.batch[0].id
+  http_method = aws_api_gateway_method.batch_post[0].http_method
+  
+  type                    = "AWS_PROXY"
+  integration_http_method = "POST"
+  uri                     = aws_lambda_function.batch[0].invoke_arn
+}
+
+resource "aws_lambda_permission" "batch" {
+  count = var.enable_batch ? 1 : 0
+  
+  statement_id  = "AllowApiGatewayInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.batch[0].function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_api_gateway_rest_api.proxy_rot.execution_arn}/*/POST/batch"
+}
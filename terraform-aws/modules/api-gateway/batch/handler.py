@@ -0,0 +1,155 @@
+"""
+PROXY ROT - batch aggregator.
+
+Lambda handler behind POST /batch on each regional API Gateway. It takes a
+list of small GET requests, fetches them in parallel from this function's
+egress and returns every response in one reply, so N tiny fetches cost one
+gateway round trip instead of N.
+
+Only paths are accepted; they are resolved against TARGET_ENDPOINT, just
+like the gateway's HTTP_PROXY integration, so this is not an open proxy.
+
+Request body:
+    {"requests": [{"path": "/ip"}, {"path": "/get?x=1", "headers": {...}}],
+     "timeout": 10}
+
+Response body:
+    {"responses": [{"status": 200, "headers": {...}, "body": "...",
+                    "encoding": "utf-8", "elapsed_ms": 12.3},
+                   {"error": "timed out"}]}
+
+Run it locally as a stand-in for the deployed function:
+    TARGET_ENDPOINT=https://httpbin.org python handler.py --serve 8080
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_REQUESTS = 25
+MAX_BODY_BYTES = 64 * 1024
+DEFAULT_TIMEOUT = 10.0
+
+
+def _fetch(target: str, item: dict, timeout: float) -> dict:
+    if not isinstance(item, dict):
+        return {'error': 'each request must be an object'}
+    path = item.get('path', '/')
+    if not isinstance(path, str) or not path.startswith('/'):
+        return {'error': 'path must start with /'}
+    
+    request_headers = item.get('headers') or {}
+    if not isinstance(request_headers, dict):
+        return {'error': 'headers must be an object'}
+    
+    request = urllib.request.Request(target + path, headers=request_headers)
+    start_time = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            status = response.status
+            headers = dict(response.headers)
+            body = response.read(MAX_BODY_BYTES + 1)
+    except urllib.error.HTTPError as e:
+        status = e.code
+        headers = dict(e.headers)
+        body = e.read(MAX_BODY_BYTES + 1)
+    except Exception as e:
+        return {'error': str(e) or type(e).__name__}
+    
+    if len(body) > MAX_BODY_BYTES:
+        return {'error': f'response body larger than {MAX_BODY_BYTES} bytes'}
+    
+    try:
+        text, encoding = body.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        text, encoding = base64.b64encode(body).decode('ascii'), 'base64'
+    
+    return {
+        'status': status,
+        'headers': headers,
+        'body': text,
+        'encoding': encoding,
+        'elapsed_ms': round((time.perf_counter() - start_time) * 1000, 2)
+    }
+
+
+def handle_batch(payload: dict, target: str) -> tuple:
+    """
+    Fan a batch out to the target and collect the responses.
+    
+    Returns:
+        Tuple of (HTTP status, response body dict)
+    """
+    if not isinstance(payload, dict):
+        return 400, {'error': 'body must be a JSON object'}
+    items = payload.get('requests')
+    if not isinstance(items, list) or not items:
+        return 400, {'error': "'requests' must be a non-empty list"}
+    if len(items) > MAX_REQUESTS:
+        return 413, {'error': f'at most {MAX_REQUESTS} requests per batch'}
+    
+    try:
+        timeout = min(float(payload.get('timeout', DEFAULT_TIMEOUT)), 25.0)
+    except (TypeError, ValueError):
+        return 400, {'error': "'timeout' must be a number"}
+    
+    with ThreadPoolExecutor(max_workers=len(items)) as executor:
+        responses = list(executor.map(lambda item: _fetch(target, item, timeout), items))
+    return 200, {'responses': responses}
+
+
+def lambda_handler(event, context):
+    """API Gateway AWS_PROXY entry point."""
+    try:
+        body = event.get('body') or '{}'
+        if event.get('isBase64Encoded'):
+            body = base64.b64decode(body).decode('utf-8')
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        status, result = 400, {'error': 'body must be JSON'}
+    else:
+        status, result = handle_batch(payload, os.environ['TARGET_ENDPOINT'].rstrip('/'))
+    
+    return {
+        'statusCode': status,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(result)
+    }
+
+
+def serve(port: int):
+    """Serve POST /batch on localhost through lambda_handler."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path.rstrip('/') != '/batch':
+                self.send_error(404)
+                return
+            length = int(self.headers.get('Content-Length') or 0)
+            event = {'body': self.rfile.read(length).decode('utf-8'), 'isBase64Encoded': False}
+            result = lambda_handler(event, None)
+            body = result['body'].encode('utf-8')
+            self.send_response(result['statusCode'])
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    print(f"Batch aggregator on http://127.0.0.1:{server.server_port}/batch -> {os.environ['TARGET_ENDPOINT']}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3 and sys.argv[1] == '--serve':
+        os.environ.setdefault('TARGET_ENDPOINT', 'https://httpbin.org')
+        serve(int(sys.argv[2]))
+    else:
+        print("Usage: python handler.py --serve PORT")
+        sys.exit(1)
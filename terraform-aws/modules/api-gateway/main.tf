@@ -4,6 +4,10 @@ terraform {
       source  = "hashicorp/aws"
       version = "~> 5.0"
     }
+    archive = {
+      source  = "hashicorp/archive"
+      version = "~> 2.0"
+    }
   }
 }
 
@@ -55,7 +59,8 @@ resource "aws_api_gateway_integration" "root_integration" {
   http_method = aws_api_gateway_method.root_any.http_method
   
   type                    = "HTTP_PROXY"
-  integration_http_method = "GET"
+  # Forward the caller's method; RotatingSession sends POST/PUT/... as well as GET
+  integration_http_method = "ANY"
   uri                     = var.target_endpoint
   
   request_parameters = {
@@ -70,7 +75,8 @@ resource "aws_api_gateway_integration" "proxy_integration" {
   http_method = aws_api_gateway_method.proxy_any.http_method
   
   type                    = "HTTP_PROXY"
-  integration_http_method = "GET"
+  # Forward the caller's method; RotatingSession sends POST/PUT/... as well as GET
+  integration_http_method = "ANY"
   uri                     = "${var.target_endpoint}/{proxy}"
   
   request_parameters = {
@@ -89,6 +95,7 @@ resource "aws_api_gateway_deployment" "proxy_rot" {
       aws_api_gateway_method.proxy_any.id,
       aws_api_gateway_integration.root_integration.id,
       aws_api_gateway_integration.proxy_integration.id,
+      aws_api_gateway_integration.batch[*].id,
     ]))
   }
   
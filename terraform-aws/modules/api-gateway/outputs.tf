@@ -18,3 +18,8 @@ output "stage_name" {
   value       = aws_api_gateway_stage.proxy_rot.stage_name
 }
 
+
+output "batch_enabled" {
+  description = "Whether POST /batch is deployed on this gateway"
+  value       = var.enable_batch
+}
@@ -13,3 +13,9 @@ variable "api_gateway_role" {
   type        = string
 }
 
+
+variable "enable_batch" {
+  description = "Deploy the POST /batch aggregator Lambda"
+  type        = bool
+  default     = false
+}
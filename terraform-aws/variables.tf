@@ -16,3 +16,8 @@ variable "aws_profile" {
   default     = "default"
 }
 
+variable "enable_batch" {
+  description = "Deploy the POST /batch aggregator Lambda on every gateway"
+  type        = bool
+  default     = false
+}
@@ -0,0 +1,89 @@
+#!/bin/bash
+#
+# PROXY ROT - AIMD Limiter Test
+# Feeds synthetic latencies and 429s to the limiter and checks its trajectory
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "AIMD LIMITER TEST"
+
+run_checks <<'EOF'
+from ip_rotator import AIMDLimiter, ConcurrencyController
+
+
+def feed(limiter, samples):
+    """Complete one request per sample (a latency in ms, or 429); return the limits after each."""
+    trajectory = []
+    for sample in samples:
+        limiter.acquire()
+        if sample == 429:
+            limiter.release(overloaded=True)
+        else:
+            limiter.release(latency_ms=sample)
+        trajectory.append(limiter.limit)
+    return trajectory
+
+
+def rising(trajectory):
+    return all(b > a for a, b in zip(trajectory, trajectory[1:]))
+
+
+def falling(trajectory):
+    return all(b < a for a, b in zip(trajectory, trajectory[1:]))
+
+
+# Steady latency: additive increase, about +1 per limit's worth of requests
+limiter = AIMDLimiter(initial=4, max_limit=64, baseline_window=20)
+trajectory = feed(limiter, [100] * 30)
+check("Steady latency raises the limit on every request", rising(trajectory))
+check("The increase is additive (about +1 per limit's worth of requests)", 8 < trajectory[-1] < 9)
+
+# 429: multiplicative decrease
+before = limiter.limit
+feed(limiter, [429])
+check("A 429 halves the limit", abs(limiter.limit - before / 2) < 1e-9)
+feed(limiter, [429] * 10)
+check("Repeated 429s stop at min_limit", limiter.limit == limiter.min_limit)
+check("Overloads leave the latency baseline alone", limiter.baseline_ms == 100)
+
+# One lucky 10 ms sample only depresses the baseline for one window
+limiter = AIMDLimiter(initial=8, max_limit=64, baseline_window=20)
+feed(limiter, [100] * 5 + [10])
+trimmed = feed(limiter, [100] * 19)
+check("After a lucky sample, normal latency looks slow and trims the limit", falling(trimmed))
+recovered = feed(limiter, [100] * 10)
+check("Once the lucky sample leaves the window the baseline is back", limiter.baseline_ms == 100)
+check("...and the limit grows again", rising(recovered))
+
+# The whole path gets slower: trim for one window, then adopt the new baseline
+limiter = AIMDLimiter(initial=8, max_limit=64, baseline_window=20)
+feed(limiter, [100] * 30)
+slow = feed(limiter, [300] * 20)
+check("A slower path first trims the limit", falling(slow[:19]))
+check("The baseline moves to the new latency after one window", limiter.baseline_ms == 300)
+check("...and the limit grows again from there", rising(feed(limiter, [300] * 10)))
+
+# Jitter inside the tolerance never trims
+limiter = AIMDLimiter(initial=4, max_limit=64, baseline_window=20)
+check("Jitter within latency_tolerance keeps increasing the limit",
+      rising(feed(limiter, [100, 150, 120, 190, 110] * 10)))
+
+# The controller exposes the learned limits
+controller = ConcurrencyController(initial=4, max_limit=16)
+for _ in range(10):
+    with controller.slot('https://a.example') as outcome:
+        outcome['status_code'] = 200
+with controller.slot('https://b.example') as outcome:
+    outcome['status_code'] = 429
+limits = controller.limits()
+check("Per-endpoint limits learn independently",
+      limits['endpoints']['https://a.example'] > 4 and limits['endpoints']['https://b.example'] == 2)
+EOF
+
+echo "✓ AIMD limiter test passed"
+echo ""
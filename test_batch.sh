@@ -0,0 +1,115 @@
+#!/bin/bash
+#
+# PROXY ROT - Batch Test
+# Checks the /batch aggregator Lambda against a local target, and that
+# batched results stay out of rotation accounting
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "BATCH TEST"
+
+run_checks <<'EOF'
+import contextlib
+import http.server
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, 'terraform-aws/modules/api-gateway/batch')
+import handler
+
+from ip_rotator import (AwsGatewayProvider, EndpointHistory, EndpointPool, GatewayManager, LocalGatewayBackend,
+                        UnifiedPool, export_ips_to_txt, run_rotation)
+
+
+class Target(http.server.BaseHTTPRequestHandler):
+    """Stand-in target: /ip answers, /status/N answers N, /slow outlives the batch timeout."""
+
+    def do_GET(self):
+        if self.path == '/slow':
+            time.sleep(2)
+        status = int(self.path.rsplit('/', 1)[1]) if self.path.startswith('/status/') else 200
+        body = json.dumps({"origin": "198.51.100.20", "path": self.path}).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Target)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+target = f"http://127.0.0.1:{server.server_port}"
+
+# Partial failures: each item fails on its own, the batch still answers 200
+status, body = handler.handle_batch({'requests': [
+    {'path': '/ip'}, {'path': '/status/503'}, {'path': 'no-slash'}, {'path': '/slow'},
+    {'path': '/ip', 'headers': 'not-an-object'}, 'not-an-object', {'path': '/ip?x=1'}
+], 'timeout': 0.5}, target)
+responses = body['responses']
+check("A batch with failing items still answers 200, one entry per item", status == 200 and len(responses) == 7)
+check("Successful items carry status, body and encoding",
+      responses[0]['status'] == 200 and responses[0]['encoding'] == 'utf-8'
+      and json.loads(responses[0]['body'])['origin'] == '198.51.100.20')
+check("Upstream HTTP errors keep their status", responses[1]['status'] == 503)
+check("Malformed items and timeouts become per-item errors",
+      all('error' in responses[n] for n in (2, 3, 4, 5)))
+check("Items stay in request order", json.loads(responses[6]['body'])['path'] == '/ip?x=1')
+
+# Item cap and malformed payloads
+status, body = handler.handle_batch({'requests': [{'path': '/ip'}] * handler.MAX_REQUESTS}, target)
+check(f"{handler.MAX_REQUESTS} items are accepted", status == 200 and len(body['responses']) == handler.MAX_REQUESTS)
+status, body = handler.handle_batch({'requests': [{'path': '/ip'}] * (handler.MAX_REQUESTS + 1)}, target)
+check(f"{handler.MAX_REQUESTS + 1} items are rejected with 413", status == 413)
+check("An empty batch is rejected", handler.handle_batch({'requests': []}, target)[0] == 400)
+check("A non-numeric timeout is rejected",
+      handler.handle_batch({'requests': [{'path': '/ip'}], 'timeout': 'soon'}, target)[0] == 400)
+
+os.environ['TARGET_ENDPOINT'] = target + '/'
+result = handler.lambda_handler({'body': '{not json'}, None)
+check("lambda_handler answers 400 to a body that is not JSON", result['statusCode'] == 400)
+result = handler.lambda_handler({'body': json.dumps({'requests': [{'path': '/ip'}]})}, None)
+check("lambda_handler wraps a batch in an API Gateway response",
+      result['statusCode'] == 200 and len(json.loads(result['body'])['responses']) == 1)
+server.shutdown()
+
+# Batched results stay out of rotation accounting
+backend = LocalGatewayBackend()
+manager = GatewayManager(backend, regions=['us-east-1'], target=1)
+pool = EndpointPool([], source_path=os.path.join(tempfile.mkdtemp(), 'endpoints.json'))
+manager.attach(pool)
+manager.reconcile()
+endpoint = manager.endpoints()[0]
+history = EndpointHistory(':memory:')
+with contextlib.redirect_stdout(io.StringIO()):
+    proxy_data = run_rotation(UnifiedPool([AwsGatewayProvider(pool, manager=manager)]), 'https://httpbin.org/ip',
+                              10, history=history, batch_size=5)
+check("Every batched result is tagged via='batch'",
+      len(proxy_data) == 10 and all(row['via'] == 'batch' for row in proxy_data))
+check("Batched results stay out of the endpoint history",
+      history.stats(endpoint) is None and not history.egress_ips(endpoint))
+check("Batched results are not fed to burn detection", not manager._gateways[endpoint]['seen_ips'])
+path = os.path.join(tempfile.mkdtemp(), 'proxies.txt')
+export_ips_to_txt(proxy_data, path)
+with open(path) as f:
+    check("Batched results are left out of the exported proxy list", f.read() == '')
+manager.close()
+EOF
+
+echo "✓ Batch test passed"
+echo ""
@@ -0,0 +1,86 @@
+#!/bin/bash
+#
+# PROXY ROT - CLI Runner Test
+# Checks CLI discovery and that gcloud calls overlap network work, using
+# stand-in gcloud/terraform scripts
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "CLI RUNNER TEST"
+
+FAKE_BIN=$(mktemp -d)
+trap 'rm -rf "$FAKE_BIN"' EXIT
+
+# gcloud: `--version` answers at once, `compute ssh` takes a second like a real ssh hop
+cat > "$FAKE_BIN/gcloud" <<'EOF'
+#!/bin/bash
+if [ "$1" = "--version" ]; then echo "Google Cloud SDK 999.0.0"; exit 0; fi
+sleep 1
+echo '{"origin": "198.51.100.7"}'
+EOF
+
+# terraform: `--version` hangs past the probe timeout (offline checkpoint), `output` works
+cat > "$FAKE_BIN/terraform" <<'EOF'
+#!/bin/bash
+if [ "$1" = "--version" ]; then exec sleep 30; fi
+echo '["https://abc123.execute-api.us-east-1.amazonaws.com/proxy"]'
+EOF
+chmod +x "$FAKE_BIN/gcloud" "$FAKE_BIN/terraform"
+
+PATH="$FAKE_BIN:$PATH" run_checks <<'EOF'
+import http.server
+import threading
+import time
+
+from ip_rotator import GcpInstanceProvider, cli_available, get_terraform_endpoints, survey_ips
+
+
+class SlowGateway(http.server.BaseHTTPRequestHandler):
+    """Stand-in API Gateway that takes a second to answer /ip."""
+
+    def do_GET(self):
+        time.sleep(1)
+        body = b'{"origin": "203.0.113.50"}'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+check("gcloud is discovered", cli_available('gcloud') is True)
+check("A hanging terraform probe is reported as unknown", cli_available('terraform') is None)
+check("Terraform endpoints still load when the probe is unknown",
+      get_terraform_endpoints() == ["https://abc123.execute-api.us-east-1.amazonaws.com/proxy"])
+
+server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), SlowGateway)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+gcp = GcpInstanceProvider(True, regions=[('us-central1', 'us-central1-a'), ('us-east1', 'us-east1-b'),
+                                         ('europe-west1', 'europe-west1-b')])
+start_time = time.perf_counter()
+snapshot = survey_ips([f"http://127.0.0.1:{server.server_port}"], gcp, deadline=10)
+elapsed = time.perf_counter() - start_time
+ok = [e for e in snapshot.entries if e['status'] == 'ok']
+check("Every AWS and GCP probe answers", len(ok) == 4)
+check("GCP instances report their egress IP", sorted(e['ip'] for e in ok if e['provider'] == 'gcp')
+      == ['198.51.100.7'] * 3)
+check(f"gcloud calls overlap the AWS probes ({elapsed:.1f}s for four 1s probes)", elapsed < 1.9)
+
+futures = [gcp.submit(region, 'https://httpbin.org/ip') for region in gcp.endpoints()]
+start_time = time.perf_counter()
+results = [future.result() for future in futures]
+check("Submitted GCP fetches run concurrently", time.perf_counter() - start_time < 1.9
+      and all(r['ip_address'] == '198.51.100.7' for r in results))
+EOF
+
+echo "✓ CLI runner test passed"
+echo ""
@@ -0,0 +1,126 @@
+#!/bin/bash
+#
+# PROXY ROT - Request Coalescing Test
+# Checks that concurrent identical GETs share one upstream request
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "REQUEST COALESCING TEST"
+
+run_checks <<'EOF'
+import http.server
+import threading
+import time
+
+import requests
+
+from ip_rotator import ConcurrencyController, RotatingSession, coalesced_get
+
+HITS = []
+HITS_LOCK = threading.Lock()
+
+
+class CountingHandler(http.server.BaseHTTPRequestHandler):
+    """Answers like httpbin.org/ip after a delay of ?delay= seconds."""
+
+    def do_GET(self):
+        with HITS_LOCK:
+            HITS.append(self.path)
+        delay = float(self.path.partition('delay=')[2] or 0.3)
+        time.sleep(delay)
+        body = b'{"origin": "203.0.113.7"}'
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client timed out and hung up; that is what the test wants
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base = f"http://127.0.0.1:{server.server_port}"
+
+
+def run_together(fn, args_list):
+    results = [None] * len(args_list)
+
+    def worker(n, args):
+        try:
+            results[n] = fn(*args)
+        except Exception as e:
+            results[n] = e
+
+    threads = [threading.Thread(target=worker, args=(n, args)) for n, args in enumerate(args_list)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+# N concurrent callers, mixed timeouts, one upstream hit
+HITS.clear()
+responses = run_together(coalesced_get, [(base + "/ip", 5 + n % 3) for n in range(16)])
+check("16 concurrent coalesced_get calls make exactly one upstream hit", len(HITS) == 1)
+check("Every caller gets a 200", all(getattr(r, 'status_code', None) == 200 for r in responses))
+check("Every caller gets its own response copy", len({id(r) for r in responses}) == 16
+      and len({id(r.headers) for r in responses}) == 16)
+
+# A waiter with a longer timeout outlives a leader whose request times out
+HITS.clear()
+results = [None, None]
+
+
+def short():
+    try:
+        results[0] = coalesced_get(base + "/ip?delay=0.6", timeout=0.3)
+    except requests.exceptions.Timeout as e:
+        results[0] = e
+
+
+def long():
+    time.sleep(0.05)
+    results[1] = coalesced_get(base + "/ip?delay=0.6", timeout=3)
+
+
+threads = [threading.Thread(target=short), threading.Thread(target=long)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+check("The short-timeout leader times out", isinstance(results[0], requests.exceptions.Timeout))
+check("The long-timeout waiter retries and succeeds", getattr(results[1], 'status_code', None) == 200)
+
+# Opt-in coalescing on the session worker pool
+events = []
+with RotatingSession(endpoints=[base], concurrency=ConcurrencyController(max_limit=16),
+                     on_event=events.append) as session:
+    HITS.clear()
+    responses = session.fetch_many(["https://httpbin.org/ip"] * 16, coalesce=True)
+    check("fetch_many(coalesce=True) makes exactly one upstream hit", len(HITS) == 1)
+    check("Only the shared request is recorded", session.metrics['requests'] == 1)
+    check("The other callers get 'coalesced' events",
+          sum(1 for e in events if e['type'] == 'coalesced') == 15)
+
+    HITS.clear()
+    session.fetch_many(["https://httpbin.org/ip"] * 4)
+    check("Without coalesce every request goes upstream", len(HITS) == 4)
+
+server.shutdown()
+EOF
+
+echo "✓ Request coalescing test passed"
+echo ""
@@ -0,0 +1,57 @@
+#!/bin/bash
+#
+# PROXY ROT - Cost Meter Test
+# Checks that uptime-billed endpoints are billed once per run and that
+# a mistyped cost objective is reported
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "COST METER TEST"
+
+run_checks <<'EOF'
+import contextlib
+import io
+import os
+
+from ip_rotator import (AwsGatewayProvider, CostAwareScheduler, CostMeter, CostModel, EndpointPool,
+                        GcpInstanceProvider, scheduler_from_env)
+
+gcp = GcpInstanceProvider(False, regions=[('us-central1', 'us-central1-a'), ('europe-west1', 'europe-west1-b')])
+model = CostModel({'gcp': {'per_request': 0.0, 'per_hour': 36.0}, 'endpoints': {}})
+meter = CostMeter(model)
+for i in range(20):
+    meter.record(gcp, gcp.endpoints()[i % 2], latency_ms=1500.0, ok=True, ip=f"10.0.1.{i}")
+
+summary = meter.summary()
+uptime = sum(model.uptime_cost('gcp', endpoint, summary['elapsed_s']) for endpoint in gcp.endpoints())
+check("GCP-only run total equals the uptime bill", abs(summary['total_cost'] - uptime) < 1e-9)
+
+aws = AwsGatewayProvider(EndpointPool(['https://abc.execute-api.us-east-1.amazonaws.com/proxy']))
+model = CostModel({'aws': {'per_request': 3.5e-6, 'per_hour': 0.0}, 'endpoints': {}})
+meter = CostMeter(model)
+for _ in range(10):
+    meter.record(aws, aws.endpoints()[0], latency_ms=200.0, ok=True)
+check("AWS-only run total equals requests x price", abs(meter.summary()['total_cost'] - 3.5e-5) < 1e-12)
+
+# A mistyped objective is reported instead of silently optimizing for success
+os.environ.update(PROXY_ROT_SCHEDULER='cost', PROXY_ROT_COST_OBJECTIVE='unique-ip')
+output = io.StringIO()
+with contextlib.redirect_stdout(output):
+    scheduler = scheduler_from_env()
+check("An unknown PROXY_ROT_COST_OBJECTIVE is warned about",
+      'PROXY_ROT_COST_OBJECTIVE' in output.getvalue() and scheduler.objective == 'success')
+try:
+    CostAwareScheduler(objective='unique-ip')
+    rejected = False
+except ValueError:
+    rejected = True
+check("CostAwareScheduler rejects an unknown objective", rejected)
+EOF
+
+echo "✓ Cost meter test passed"
+echo ""
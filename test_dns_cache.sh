@@ -0,0 +1,109 @@
+#!/bin/bash
+#
+# PROXY ROT - DNS Cache Test
+# Checks cache hits, stale-while-refresh and fallback past a dead address,
+# using a stand-in resolver and a local server
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "DNS CACHE TEST"
+
+run_checks <<'EOF'
+import http.server
+import socket
+import threading
+import time
+
+from ip_rotator import DnsCache, get_dns_cache, new_session
+
+RECORDS = {}
+LOOKUPS = []
+DELAY = [0.0]
+real_getaddrinfo = socket.getaddrinfo
+
+
+def fake_getaddrinfo(host, port, *args, **kwargs):
+    """Answer for the .test hosts in RECORDS; everything else resolves normally."""
+    if host not in RECORDS:
+        return real_getaddrinfo(host, port, *args, **kwargs)
+    LOOKUPS.append(host)
+    time.sleep(DELAY[0])
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port)) for address in RECORDS[host]]
+
+
+socket.getaddrinfo = fake_getaddrinfo
+
+# Hit, full address list
+cache = DnsCache(ttl=0.3)
+RECORDS['gw.test'] = ['192.0.2.1', '192.0.2.2', '192.0.2.1']
+addresses, cached = cache.lookup('gw.test', 443)
+check("A miss resolves every address once, in order", addresses == ['192.0.2.1', '192.0.2.2'] and not cached)
+addresses, cached = cache.lookup('gw.test', 443)
+check("A second lookup is a cache hit", cached and LOOKUPS == ['gw.test'])
+check("IP literals bypass the resolver", cache.lookup('203.0.113.5', 443) == (['203.0.113.5'], True))
+
+# Expiry: the stale entry is served while a slow refresh runs in the background
+RECORDS['gw.test'] = ['192.0.2.9']
+DELAY[0] = 0.5
+time.sleep(0.35)
+start_time = time.perf_counter()
+addresses, cached = cache.lookup('gw.test', 443)
+check("An expired entry is still served without waiting",
+      addresses == ['192.0.2.1', '192.0.2.2'] and time.perf_counter() - start_time < 0.1)
+cache.lookup('gw.test', 443)
+time.sleep(0.7)
+check("Only one background refresh runs per entry", LOOKUPS.count('gw.test') == 2)
+check("The refreshed addresses replace the stale ones", cache.lookup('gw.test', 443)[0] == ['192.0.2.9'])
+DELAY[0] = 0.0
+
+cache.invalidate('gw.test')
+cache.lookup('gw.test', 443)
+check("invalidate() forces the next lookup to resolve", LOOKUPS.count('gw.test') == 3)
+
+
+# Eviction on failure: the first address refuses, the second serves
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"origin": "203.0.113.9"}'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+server.daemon_threads = True
+threading.Thread(target=server.serve_forever, daemon=True).start()
+
+# Nothing listens on 127.0.0.2, so connecting there is refused at once
+RECORDS['dead-first.test'] = ['127.0.0.2', '127.0.0.1']
+session = new_session()
+response = session.get(f"http://dead-first.test:{server.server_port}/ip", timeout=5)
+check("A refused address falls through to the next one", response.status_code == 200)
+session.close()
+
+before = LOOKUPS.count('dead-first.test')
+get_dns_cache().lookup('dead-first.test', server.server_port)
+check("The failed host is evicted and resolved afresh", before == 1
+      and LOOKUPS.count('dead-first.test') == 2)
+
+RECORDS['all-dead.test'] = ['127.0.0.2', '127.0.0.3']
+try:
+    new_session().get(f"http://all-dead.test:{server.server_port}/ip", timeout=5)
+    failed = False
+except Exception:
+    failed = True
+check("When every address fails the connection error is raised", failed)
+server.shutdown()
+EOF
+
+echo "✓ DNS cache test passed"
+echo ""
@@ -0,0 +1,97 @@
+#!/bin/bash
+#
+# PROXY ROT - Endpoint Pool Test
+# Checks that the live pool follows a rewritten endpoints file
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "ENDPOINT POOL TEST"
+
+run_checks <<'EOF'
+import http.server
+import os
+import tempfile
+import threading
+import time
+
+from ip_rotator import EndpointPool
+
+
+def start_endpoint(status=200, delay=0.0):
+    """Local stand-in for a gateway: answers /ip with the given status."""
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = b'{"origin": "203.0.113.9"}'
+            self.send_response(status)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def write_endpoints(path, endpoints, bump):
+    with open(path, 'w') as f:
+        f.write("# endpoints\n" + "\n".join(endpoints) + "\n")
+    # Force a new mtime even on filesystems with coarse timestamps
+    os.utime(path, (time.time() + bump, time.time() + bump))
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+first, second = start_endpoint(), start_endpoint()
+broken = start_endpoint(status=404)
+path = os.path.join(tempfile.mkdtemp(), 'endpoints.txt')
+write_endpoints(path, [first], bump=0)
+
+changes = []
+pool = EndpointPool([first], source_path=path, poll_interval=0.1,
+                    on_change=lambda added, removed: changes.append((added, removed)))
+pool.start()
+
+write_endpoints(path, [first, second, broken], bump=10)
+check("A new endpoint in the file is added after its readiness check",
+      wait_for(lambda: second in pool.snapshot()))
+check("An endpoint that fails the readiness check is not added", broken not in pool.snapshot())
+
+write_endpoints(path, [second], bump=20)
+check("An endpoint removed from the file is drained", wait_for(lambda: first not in pool.snapshot()))
+check("on_change reports additions and removals", ([second], []) in changes and ([], [first]) in changes)
+
+write_endpoints(path, [], bump=30)
+time.sleep(0.4)
+check("An empty or half-written file does not empty the pool", pool.snapshot() == (second,))
+pool.stop()
+
+# add() and refresh() racing on the same slow endpoint insert it once
+slow = start_endpoint(delay=0.3)
+write_endpoints(path, [second, slow], bump=40)
+racer = threading.Thread(target=pool.add, args=([slow],))
+racer.start()
+pool.refresh()
+racer.join()
+check("A concurrent add() and refresh() insert an endpoint only once", pool.snapshot().count(slow) == 1)
+EOF
+
+echo "✓ Endpoint pool test passed"
+echo ""
@@ -0,0 +1,68 @@
+#!/bin/bash
+#
+# PROXY ROT - Gateway Manager Test
+# Checks warm-pool fill, burn retirement and reconcile against local gateways
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "GATEWAY MANAGER TEST"
+
+run_checks <<'EOF'
+import os
+import tempfile
+
+from ip_rotator import AwsGatewayProvider, EndpointPool, GatewayManager, LocalGatewayBackend
+
+backend = LocalGatewayBackend()
+manager = GatewayManager(backend, regions=['us-east-1', 'eu-west-1'], target=3, burn_threshold=2)
+pool = EndpointPool([], source_path=os.path.join(tempfile.mkdtemp(), 'endpoints.json'))
+manager.attach(pool)
+provider = AwsGatewayProvider(pool, manager=manager)
+
+# Warm-pool fill
+created, retired = manager.reconcile()
+regions = sorted(gateway['region'] for gateway in created)
+check("Reconcile fills the warm pool to the target", len(created) == 3 and not retired)
+check("Warm gateways are spread over the regions", regions == ['eu-west-1', 'us-east-1', 'us-east-1'])
+check("Warm gateways are published to the pool", sorted(pool.snapshot()) == sorted(manager.endpoints()))
+
+# Burn-threshold retirement
+victim = created[0]
+for ip in victim['ips']:
+    backend.block(ip)
+for _ in range(2):
+    try:
+        provider.fetch(victim['endpoint'], 'https://httpbin.org/ip')
+    except Exception:
+        pass
+check("Blocked responses up to the threshold burn the gateway", victim['endpoint'] not in manager.endpoints())
+check("A burned gateway's egress IPs are remembered", set(victim['ips']) <= manager.burned_ips)
+
+created, retired = manager.reconcile()
+check("Reconcile retires the burned gateway", [g['endpoint'] for g in retired] == [victim['endpoint']])
+check("Reconcile replaces it", len(created) == 1 and len(pool.snapshot()) == 3)
+check("The burned gateway is drained and deleted",
+      victim['endpoint'] not in pool.snapshot() and victim['id'] not in backend._servers)
+
+# A healthy gateway that egresses from a burned IP is burned at once
+survivor = manager.endpoints()[0]
+manager.observe(survivor, 200, victim['ips'][0])
+check("Egress through a burned IP burns the gateway", survivor not in manager.endpoints())
+
+created, retired = manager.reconcile()
+check("Reconcile converges back to the target", len(created) == 1 and len(retired) == 1
+      and len(manager.endpoints()) == 3)
+created, retired = manager.reconcile()
+check("Reconcile is a no-op once the pool is at target", not created and not retired)
+
+manager.close()
+check("Closing the manager deletes every gateway", not pool.snapshot() and not backend._servers)
+EOF
+
+echo "✓ Gateway manager test passed"
+echo ""
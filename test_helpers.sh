@@ -0,0 +1,54 @@
+#!/bin/bash
+#
+# PROXY ROT - Shared Test Helpers
+# Sourced by the test_*.sh scripts; not meant to be run on its own
+#
+
+PYTHON="${PYTHON:-python3}"
+
+# Print the boxed banner every test script starts with
+print_banner() {
+    local title="PROXY ROT - $1"
+    local width=60
+    local left=$(( (width - ${#title}) / 2 ))
+    local right=$(( width - ${#title} - left ))
+
+    echo "╔════════════════════════════════════════════════════════════╗"
+    echo "║                                                            ║"
+    printf "║%*s%s%*s║\n" "$left" "" "$title" "$right" ""
+    echo "║                                                            ║"
+    echo "╚════════════════════════════════════════════════════════════╝"
+    echo ""
+}
+
+# Python run before every check script: an in-memory endpoint history (so
+# tests never touch the persisted one) and a check(name, ok) reporter
+TEST_PRELUDE=$(cat <<'EOF'
+import sys
+
+from ip_rotator import EndpointHistory, set_endpoint_history
+
+# Keep the test out of the persisted endpoint history
+set_endpoint_history(EndpointHistory(':memory:'))
+
+FAILED = False
+
+
+def check(name, ok):
+    global FAILED
+    print(f"  {'✓' if ok else '✗'} {name}")
+    FAILED = FAILED or not ok
+EOF
+)
+
+# Run the Python check script read from stdin; fails if any check() failed
+run_checks() {
+    local body
+    body=$(cat)
+    "$PYTHON" -c "$TEST_PRELUDE
+
+$body
+
+print()
+sys.exit(1 if FAILED else 0)"
+}
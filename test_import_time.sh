@@ -0,0 +1,56 @@
+#!/bin/bash
+#
+# PROXY ROT - Import Time Budget Test
+# Checks that importing ip_rotator stays cheap for job runners
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+PYTHON="${PYTHON:-python3}"
+BUDGET_US="${IMPORT_BUDGET_US:-100000}"
+HEAVY_MODULES=("requests" "urllib3" "asyncio" "subprocess" "boto3" "google")
+
+echo "╔════════════════════════════════════════════════════════════╗"
+echo "║                                                            ║"
+echo "║           PROXY ROT - IMPORT TIME BUDGET TEST              ║"
+echo "║                                                            ║"
+echo "╚════════════════════════════════════════════════════════════╝"
+echo ""
+
+# Warm the bytecode cache so we measure imports, not compilation
+"$PYTHON" -c "import ip_rotator" > /dev/null
+
+IMPORT_LOG=$("$PYTHON" -X importtime -c "import ip_rotator" 2>&1 >/dev/null)
+
+FAILED=0
+
+# Heavy packages must only be imported when a code path needs them
+for MODULE in "${HEAVY_MODULES[@]}"; do
+    if echo "$IMPORT_LOG" | grep -qE "\|[[:space:]]+${MODULE}(\.|$)"; then
+        echo "  ✗ $MODULE is imported at startup"
+        FAILED=1
+    else
+        echo "  ✓ $MODULE not imported at startup"
+    fi
+done
+
+CUMULATIVE_US=$(echo "$IMPORT_LOG" | grep -E "\| ip_rotator$" | awk -F'|' '{gsub(/ /, "", $2); print $2}')
+
+echo ""
+if [ "$CUMULATIVE_US" -gt "$BUDGET_US" ]; then
+    echo "  ✗ ip_rotator import took ${CUMULATIVE_US}us (budget ${BUDGET_US}us)"
+    FAILED=1
+else
+    echo "  ✓ ip_rotator import took ${CUMULATIVE_US}us (budget ${BUDGET_US}us)"
+fi
+echo ""
+
+if [ "$FAILED" -ne 0 ]; then
+    echo "✗ Import time budget test failed"
+    exit 1
+fi
+
+echo "✓ Import time budget test passed"
+echo ""
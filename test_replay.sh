@@ -0,0 +1,124 @@
+#!/bin/bash
+#
+# PROXY ROT - Record/Replay Test
+# Records a rotation run against local stand-in gateways and replays it
+# with the network shut off
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "RECORD/REPLAY TEST"
+
+run_checks <<'EOF'
+import contextlib
+import gzip
+import io
+import os
+import socket
+import tempfile
+
+import requests
+
+from ip_rotator import (AwsGatewayProvider, EndpointPool, LocalGatewayBackend, TapePlayer, UnifiedPool,
+                        run_rotation, start_recording, stop_recording, taped)
+
+NUM_REQUESTS = 6
+
+
+def observe(provider, log):
+    """Log (endpoint, ip, status) for every fetch through provider, errors included."""
+    fetch = provider.fetch
+
+    def logged(endpoint, target_url, timeout=20):
+        try:
+            result = fetch(endpoint, target_url, timeout)
+        except requests.exceptions.HTTPError as e:
+            log.append((endpoint, None, e.response.status_code))
+            raise
+        log.append((endpoint, result['ip_address'], result['status_code']))
+        return result
+    provider.fetch = logged
+    return provider
+
+
+def rotate(providers):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_rotation(UnifiedPool(providers), 'https://httpbin.org/ip', NUM_REQUESTS)
+
+
+# Record a run through three local gateways, one of them blocked
+backend = LocalGatewayBackend()
+gateways = [backend.create(region) for region in ('us-east-1', 'eu-west-1', 'ap-south-1')]
+for ip in gateways[1]['ips']:
+    backend.block(ip)
+provider = AwsGatewayProvider(EndpointPool([g['endpoint'] for g in gateways]))
+
+tape_dir = tempfile.mkdtemp()
+plain_path = os.path.join(tape_dir, 'run.jsonl')
+recorded = []
+start_recording(plain_path)
+try:
+    recorded_data = rotate([observe(p, recorded) for p in taped([provider])])
+finally:
+    stop_recording()
+for gateway in gateways:
+    backend.delete(gateway)
+check(f"The recorded run made {NUM_REQUESTS} requests, blocked ones included",
+      len(recorded) == NUM_REQUESTS and 403 in [status for _, _, status in recorded])
+
+# Replay with every outbound connection refused
+real_connect = socket.socket.connect
+connections = []
+
+
+def no_network(sock, address):
+    connections.append(address)
+    raise OSError("network disabled for replay")
+
+
+socket.socket.connect = no_network
+try:
+    replayed = []
+    replayed_data = rotate([observe(p, replayed) for p in TapePlayer(plain_path, speed=0).providers()])
+finally:
+    socket.socket.connect = real_connect
+check("Replay opens no connections", not connections)
+check("Replay reproduces the endpoint, IP and status sequence", replayed == recorded)
+check("Replay reproduces the exported results",
+      [(d['ip_address'], d['status_code'], d['response_time_ms']) for d in replayed_data]
+      == [(d['ip_address'], d['status_code'], d['response_time_ms']) for d in recorded_data])
+
+# A gzipped tape loads the same exchanges
+gz_path = plain_path + '.gz'
+with open(plain_path, 'rb') as src, gzip.open(gz_path, 'wb') as dst:
+    dst.write(src.read())
+replayed = []
+rotate([observe(p, replayed) for p in TapePlayer(gz_path, speed=0).providers()])
+check("A gzipped tape replays identically", replayed == recorded)
+
+# A run killed mid-write leaves a partial last line (plain) or no end marker (gzip)
+with open(plain_path) as f:
+    lines = f.readlines()
+cut_path = os.path.join(tape_dir, 'cut.jsonl')
+with open(cut_path, 'w') as f:
+    f.writelines(lines[:-1])
+    f.write(lines[-1][:len(lines[-1]) // 2])
+player = TapePlayer(cut_path, speed=0)
+exchanges = sum(len(v) for v in player._providers['aws']['exchanges'].values())
+check("A truncated tape loads its complete exchanges", player.truncated and exchanges == NUM_REQUESTS - 1)
+
+with open(gz_path, 'rb') as f:
+    compressed = f.read()
+cut_gz_path = os.path.join(tape_dir, 'cut.jsonl.gz')
+with open(cut_gz_path, 'wb') as f:
+    f.write(compressed[:-12])
+player = TapePlayer(cut_gz_path, speed=0)
+check("A gzipped tape without its end marker still loads", player.truncated and player.names() == ['aws'])
+EOF
+
+echo "✓ Record/replay test passed"
+echo ""
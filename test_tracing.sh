@@ -0,0 +1,67 @@
+#!/bin/bash
+#
+# PROXY ROT - Tracing Test
+# Checks head sampling of whole traces and that buffered spans survive exit
+#
+
+set -e
+
+cd "$(dirname "$0")"
+
+. ./test_helpers.sh
+
+print_banner "TRACING TEST"
+
+run_checks <<'EOF'
+import json
+import os
+import subprocess
+import tempfile
+
+from ip_rotator import Tracer, current_span
+
+# A dropped root takes its children with it instead of re-rolling the sampler
+rolls = []
+spans = []
+
+
+def drop_roots(name, attributes):
+    rolls.append(name)
+    return False
+
+
+tracer = Tracer(sampler=drop_roots, sink=spans.append)
+with tracer.span('root'):
+    with tracer.span('child'):
+        with tracer.span('grandchild'):
+            inner = current_span()
+check("The sampler is consulted once per trace", rolls == ['root'])
+check("Children of a dropped root are dropped", not spans and inner is None)
+
+with tracer.span('next root'):
+    pass
+check("The next root is sampled afresh", rolls == ['root', 'next root'])
+
+tracer = Tracer(sink=spans.append)
+with tracer.span('root'):
+    with tracer.span('child'):
+        pass
+check("Children of a sampled root are recorded under it",
+      [s['name'] for s in spans] == ['child', 'root'] and spans[0]['parent_span_id'] == spans[1]['span_id'])
+
+# A library user that never calls close() still gets its spans
+path = os.path.join(tempfile.mkdtemp(), 'trace.jsonl')
+subprocess.run([sys.executable, '-c', f"""
+from ip_rotator import Tracer
+tracer = Tracer({path!r})
+for n in range(3):
+    with tracer.span('request', n=n):
+        pass
+"""], check=True)
+with open(path) as f:
+    lines = [json.loads(line) for line in f]
+check("Buffered spans are written at interpreter exit", [s['attributes']['n'] for s in lines] == [0, 1, 2])
+EOF
+
+echo "✓ Tracing test passed"
+echo ""